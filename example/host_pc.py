@@ -33,8 +33,9 @@ uint16 fuel_left_dl    // 油箱余量，单位0.1L
 uint16 fuel_total_dl   // 油箱总量，单位0.1L
 ... reserve(可选)
 
-依赖：
-pip install pyserial pillow
+依赖（Python 3.10+）：
+pip install pyserial pillow numpy
+可选（加速 r565 转换）：pip install numba
 """
 
 import argparse
@@ -43,14 +44,25 @@ import random
 import struct
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import io
 import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import Optional, List
 
+import numpy as np
 import serial
 from PIL import Image
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 TRACK_URL = "https://azurehk.crazythursdayvivo50.cn/trace/track/image"
 MAX_PNG_SIZE = 200 * 1024  # 200KB
 
@@ -61,6 +73,16 @@ MSG_CMD_REBOOT = 0x01
 MSG_CMD_BRIGHTNESS = 0x02
 MSG_CMD_OFFSET_ROTATION = 0x03
 
+# 预编译 struct，避免每帧重复解析格式串
+# <I B B H I I I  = 4 +1+1+2 +4+4+4 = 20 bytes
+_HDR = struct.Struct("<IBBHIII")
+# < h h i i h h h H H H H = 2+2+4+4+2+2+2+2+2+2+2 = 26 bytes
+_MSGF = struct.Struct("<hhiihhhHHHH")
+_U32 = struct.Struct("<I")
+# 预先绑定 pack 方法，热路径上省去每次的属性查找
+_pack_hdr = _HDR.pack
+_pack_msgf_into = _MSGF.pack_into
+
 
 def u32_le_from_magic(magic4: bytes) -> int:
     if len(magic4) != 4:
@@ -68,9 +90,18 @@ def u32_le_from_magic(magic4: bytes) -> int:
     return struct.unpack("<I", magic4)[0]
 
 
-def pack_header(magic4: bytes, payload_len: int, seq: int, typ: int = 0, flags: int = 0, crc32: int = 0) -> bytes:
-    # <I B B H I I I  = 4 +1+1+2 +4+4+4 = 20 bytes
-    return struct.pack("<IBBHIII", u32_le_from_magic(magic4), typ & 0xFF, flags & 0xFF, 0, payload_len, crc32 & 0xFFFFFFFF, seq & 0xFFFFFFFF)
+# magic 为常量，模块加载时转换一次，避免每帧 unpack
+MAGIC_MSGF_U32 = u32_le_from_magic(MAGIC_MSGF)
+MAGIC_IMGF_U32 = u32_le_from_magic(MAGIC_IMGF)
+
+# 状态快照 MSGF 帧长度固定：header + cmd + snapshot = 20 + 1 + 26 = 47 bytes
+_MSGF_SEQ_OFFSET = _HDR.size - _U32.size
+_MSGF_SNAPSHOT_OFFSET = _HDR.size + 1
+MSGF_SNAPSHOT_FRAME_SIZE = _MSGF_SNAPSHOT_OFFSET + _MSGF.size
+
+
+def pack_header(magic_u32: int, payload_len: int, seq: int, typ: int = 0, flags: int = 0, crc32: int = 0) -> bytes:
+    return _pack_hdr(magic_u32, typ & 0xFF, flags & 0xFF, 0, payload_len, crc32 & 0xFFFFFFFF, seq & 0xFFFFFFFF)
 
 
 def hhmm_to_minutes(hhmm: str) -> int:
@@ -90,23 +121,64 @@ class TrackImageFetcher:
         self.track_url = track_url
         self.basic_auth = basic_auth
         self.count = 0
+        # 复用 TCP/TLS 连接，避免每次拉图重新握手
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.headers = {
+            "Content-Type": "application/json",
+            "accept": "application/json"
+        }
+        # 拉图放到后台 daemon 线程，10s 的 HTTP 超时不会阻塞 MSGF 主循环，
+        # 退出时也不会等待进行中的请求
+        self._future: Optional[Future] = None
+        # 仅缓存最近一次的 (点数, 请求体)：count 单调递增，只有走完整条轨迹、
+        # 点数被截断到 len(points) 后才会命中
+        self._json_cache: Optional[tuple[int, bytes]] = None
+
+    def close(self):
+        self.session.close()
+
+    @property
+    def pending(self) -> bool:
+        return self._future is not None
+
+    def start_fetch(self):
+        """后台发起一次 fetch_next；已有请求未完成时忽略"""
+        if self._future is None:
+            self._future = Future()
+            threading.Thread(target=self._fetch_worker, args=(self._future,), name="TrackFetch", daemon=True).start()
+
+    def _fetch_worker(self, future: Future):
+        now = time.monotonic()
+        try:
+            png = self.fetch_next()
+        except BaseException as exc:
+            future.set_exception(exc)
+            return
+        future.set_result((png, int((time.monotonic() - now) * 1000)))
+
+    def poll(self) -> Optional[tuple[bytes, int]]:
+        """后台请求完成时返回 (PNG, 耗时 ms)，否则返回 None；请求失败时抛出对应异常"""
+        if self._future is None or not self._future.done():
+            return None
+        future, self._future = self._future, None
+        return future.result()
 
     def fetch_next(self) -> bytes:
-        now = time.time()
         self.count += 1
-        if self.count == 1:
-            body = {"points": self.points[:2]}
+        n = min(max(2, self.count), len(self.points))
+        if self._json_cache is not None and self._json_cache[0] == n:
+            body = self._json_cache[1]
         else:
-            body = {"points": self.points[:self.count]}
-        header = {
-            "Content-Type": "application/json",
-            "accept": "application/json"
-        }
+            body = json.dumps({"points": self.points[:n]}).encode("utf-8")
+            self._json_cache = (n, body)
 
-        resp = requests.post(
+        resp = self.session.post(
             self.track_url,
-            json=body,
-            headers=header,
+            data=body,
+            headers=self.headers,
             auth=self.basic_auth,
             timeout=10,
         )
@@ -115,13 +187,11 @@ class TrackImageFetcher:
         png = resp.content
         if len(png) > MAX_PNG_SIZE:
             raise ValueError(f"PNG too large: {len(png)} bytes")
-        
-        print(f"\r\n Fetched {len(png)} bytes in {int((time.time() - now) * 1000):03d} ms")
 
         return png
 
 
-@dataclass
+@dataclass(slots=True)
 class MsgfSnapshot:
     speed_kmh: int = 0
     engine_rpm: int = 0
@@ -136,74 +206,198 @@ class MsgfSnapshot:
     fuel_total_dl: int = 0       # 油箱总量，单位0.1L
 
     def pack(self) -> bytes:
-        # < h h i i h h h H H H H = 2+2+4+4+2+2+2+2+2+2+2 = 26 bytes
-        return struct.pack(
-            "<hhiihhhHHHH",
-            int(self.speed_kmh),
-            int(self.engine_rpm),
-            int(self.odo_m),
-            int(self.trip_odo_m),
-            int(self.outside_temp_c),
-            int(self.inside_temp_c),
-            int(self.battery_mv),
-            int(self.curr_time_min) & 0xFFFF,
-            int(self.trip_time_min) & 0xFFFF,
-            int(self.fuel_left_dl) & 0xFFFF,
-            int(self.fuel_total_dl) & 0xFFFF,
+        buf = bytearray(_MSGF.size)
+        self.pack_into(buf, 0)
+        return bytes(buf)
+
+    def pack_into(self, buf: bytearray, offset: int):
+        # 字段须为 int（调用方均已保证），struct 遇到非整数会直接报错
+        _pack_msgf_into(
+            buf,
+            offset,
+            self.speed_kmh,
+            self.engine_rpm,
+            self.odo_m,
+            self.trip_odo_m,
+            self.outside_temp_c,
+            self.inside_temp_c,
+            self.battery_mv,
+            self.curr_time_min & 0xFFFF,
+            self.trip_time_min & 0xFFFF,
+            self.fuel_left_dl & 0xFFFF,
+            self.fuel_total_dl & 0xFFFF,
         )
 
 
 class HostSender:
-    def __init__(self, port: str, baud: int = 115200, timeout: float = 0):
+    def __init__(self, port: str, baud: int = 115200, timeout: float = 0, low_latency: bool = True,
+                 tx_queue_size: int = 8):
         # 对 CDC ACM，波特率一般无意义，但 pyserial 仍要求填
         self.ser = serial.Serial(port=port, baudrate=baud, timeout=timeout, write_timeout=1)
+        if low_latency:
+            # Linux 下设置 ASYNC_LOW_LATENCY，减少内核缓冲带来的延迟抖动；其他平台/驱动不支持时忽略
+            try:
+                self.ser.set_low_latency_mode(True)
+            except (AttributeError, OSError, ValueError):
+                pass
         self.seq = 1
+        # 状态快照帧模板：magic/type/flags/len/cmd 预先填好，发送时只改写 seq 与快照字段
+        self._msgf_template = bytearray(MSGF_SNAPSHOT_FRAME_SIZE)
+        _HDR.pack_into(self._msgf_template, 0, MAGIC_MSGF_U32, 0, 0, 0, 1 + _MSGF.size, 0, 0)
+        self._msgf_template[_HDR.size] = MSG_CMD_SNAPSHOT
+        # 通用 MSGF（cmd + snapshot）payload 缓冲区，send_frame 拼帧时会复制，可安全复用
+        self._payload_buf = bytearray(1 + _MSGF.size)
+        self._payload_view = memoryview(self._payload_buf)
+        # 本地图片缓存：path -> (文件标识, 数据)，文件未变化时不再重复读盘/转换
+        self._png_cache: dict[str, tuple[tuple, bytes]] = {}
+        self._r565_cache: dict[str, tuple[tuple, bytearray]] = {}
+        # 串口写入放到后台线程，write 阻塞（最长 write_timeout）时不拖慢主循环节拍
+        # 队列元素为 (frame, droppable, log_name)，仅状态快照可丢弃；log_name 非空时打印实际写入耗时
+        self._tx_queue: "deque[tuple[bytes, bool, Optional[str]]]" = deque()
+        self._tx_queue_size = tx_queue_size
+        self._tx_cond = threading.Condition()
+        self._tx_closing = False
+        self._tx_error: Optional[BaseException] = None
+        self._tx_thread = threading.Thread(target=self._writer_loop, name="HostSenderTx", daemon=True)
+        self._tx_thread.start()
+
+    def _writer_loop(self):
+        while True:
+            with self._tx_cond:
+                while not self._tx_queue and not self._tx_closing:
+                    self._tx_cond.wait()
+                if not self._tx_queue:
+                    return
+                frame, _, log_name = self._tx_queue.popleft()
+                self._tx_cond.notify_all()
+            try:
+                now = time.monotonic()
+                self.ser.write(frame)
+                if log_name:
+                    print(f" Sent {log_name} {len(frame) - _HDR.size} bytes in {int((time.monotonic() - now) * 1000):03d} ms")
+            except Exception as exc:
+                # 含写超时：帧可能已部分发出，下位机会按 len 把后续帧当作 payload 吞掉，
+                # 继续发送只会让流静默错位，因此停止发送并在下次 send 时抛出
+                with self._tx_cond:
+                    self._tx_error = exc
+                    self._tx_cond.notify_all()
+                return
+
+    def _enqueue(self, frame: bytes, droppable: bool = False, log_name: Optional[str] = None):
+        # 队列满时：状态快照丢弃最旧的快照，保证最新数据优先发出；
+        # IMGF 与命令帧不可丢弃，没有可让出的快照时阻塞等待
+        with self._tx_cond:
+            while True:
+                if self._tx_error is not None:
+                    raise self._tx_error
+                if len(self._tx_queue) < self._tx_queue_size:
+                    break
+                for i, (_, old_droppable, _) in enumerate(self._tx_queue):
+                    if old_droppable:
+                        del self._tx_queue[i]
+                        break
+                else:
+                    if droppable:
+                        # 队列全是不可丢弃帧，放弃本次快照，不阻塞主循环
+                        return
+                    self._tx_cond.wait()
+                    continue
+                break
+            self._tx_queue.append((frame, droppable, log_name))
+            self._tx_cond.notify_all()
 
     def close(self):
+        # 先等待队列中的帧发完，再关闭串口
+        with self._tx_cond:
+            self._tx_closing = True
+            self._tx_cond.notify_all()
+        self._tx_thread.join(timeout=5)
         try:
             self.ser.close()
         except Exception:
             pass
 
-    def send_frame(self, magic4: bytes, payload: bytes, typ: int = 0, flags: int = 0):
-        hdr = pack_header(magic4, len(payload), self.seq, typ=typ, flags=flags, crc32=0)
-        self.ser.write(hdr)
-        self.ser.write(payload)
+    def send_frame(self, magic_u32: int, payload: bytes, typ: int = 0, flags: int = 0, droppable: bool = False,
+                   log_name: Optional[str] = None):
+        hdr = pack_header(magic_u32, len(payload), self.seq, typ=typ, flags=flags, crc32=0)
+        # header 与 payload 合并为一次 write，CDC ACM 上每次 write 都是一次独立的 USB 传输
+        self._enqueue(hdr + payload, droppable=droppable, log_name=log_name)
         self.seq += 1
 
     def send_msgf(self, snap: MsgfSnapshot, cmd: int = MSG_CMD_SNAPSHOT):
-        payload = struct.pack("<B", cmd & 0xFF) + snap.pack()
-        self.send_frame(MAGIC_MSGF, payload)
+        self._payload_buf[0] = cmd & 0xFF
+        snap.pack_into(self._payload_buf, 1)
+        self.send_frame(MAGIC_MSGF_U32, self._payload_view, droppable=(cmd == MSG_CMD_SNAPSHOT))
+
+    def send_msgf_fast(self, snap: MsgfSnapshot):
+        """发送状态快照（CMD=0x00），基于预填充的帧模板，等价于 send_msgf(snap)"""
+        buf = self._msgf_template
+        _U32.pack_into(buf, _MSGF_SEQ_OFFSET, self.seq & 0xFFFFFFFF)
+        snap.pack_into(buf, _MSGF_SNAPSHOT_OFFSET)
+        # 模板会被下一帧复用，入队的是快照副本
+        self._enqueue(bytes(buf), droppable=True)
+        self.seq += 1
 
     def send_msgf_cmd_only(self, cmd: int):
         payload = struct.pack("<B", cmd & 0xFF)
-        self.send_frame(MAGIC_MSGF, payload)
+        self.send_frame(MAGIC_MSGF_U32, payload)
 
     def send_brightness(self, brightness: int):
         payload = struct.pack("<BB", MSG_CMD_BRIGHTNESS, int(brightness) & 0xFF)
-        self.send_frame(MAGIC_MSGF, payload)
+        self.send_frame(MAGIC_MSGF_U32, payload)
 
     def send_offset_rotation(self, offset_rotation: int):
         payload = struct.pack("<BB", MSG_CMD_OFFSET_ROTATION, int(offset_rotation) & 0xFF)
-        self.send_frame(MAGIC_MSGF, payload)
+        self.send_frame(MAGIC_MSGF_U32, payload)
+
+    def load_png(self, png_path: str) -> bytes:
+        st = os.stat(png_path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._png_cache.get(png_path)
+        if cached is None or cached[0] != key:
+            with open(png_path, "rb") as f:
+                cached = (key, f.read())
+            self._png_cache[png_path] = cached
+        return cached[1]
+
+    def load_r565_frame(self, png_path: str, resize_to: Optional[tuple[int, int]] = None,
+                        swap_bytes: bool = False) -> bytearray:
+        st = os.stat(png_path)
+        key = (st.st_mtime_ns, st.st_size, resize_to, swap_bytes)
+        cached = self._r565_cache.get(png_path)
+        if cached is None or cached[0] != key:
+            frame = png_to_r565_frame(self.load_png(png_path), resize_to, swap_bytes=swap_bytes)
+            cached = (key, frame)
+            self._r565_cache[png_path] = cached
+        return cached[1]
 
     def send_imgf(self, png_path: str):
-        with open(png_path, "rb") as f:
-            png = f.read()
-        self.send_frame(MAGIC_IMGF, png)
+        self.send_frame(MAGIC_IMGF_U32, self.load_png(png_path))
     
     def send_imgf_bytes(self, png: bytes):
-        now = time.time()
-        self.send_frame(MAGIC_IMGF, png)
-        print(f" Sent IMGF {len(png)} bytes in {int((time.time() - now) * 1000):03d} ms")
+        self.send_frame(MAGIC_IMGF_U32, png, log_name="IMGF")
 
     def send_imgf_r565_bytes(self, frame: bytes):
-        now = time.time()
-        self.send_frame(MAGIC_IMGF, frame)
-        print(f" Sent IMGF(R565) {len(frame)} bytes in {int((time.time() - now) * 1000):03d} ms")
+        self.send_frame(MAGIC_IMGF_U32, frame, log_name="IMGF(R565)")
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _rgb_to_565(arr_u8, out_u16):
+        # arr_u8: (N, 3) RGB888，out_u16: (N,) 本机字节序 RGB565
+        for i in prange(arr_u8.shape[0]):
+            r = np.uint16(arr_u8[i, 0])
+            g = np.uint16(arr_u8[i, 1])
+            b = np.uint16(arr_u8[i, 2])
+            out_u16[i] = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
 
+    # numba 首次调用才编译，导入时先用 1 像素预热，避免编译耗时落在 24Hz 主循环里
+    _rgb_to_565(np.zeros((1, 3), dtype=np.uint8), np.zeros(1, dtype=np.uint16))
+else:
+    _rgb_to_565 = None
 
-def png_to_r565_frame(png: bytes, resize_to: Optional[tuple[int, int]] = None, swap_bytes: bool = False) -> bytes:
+
+def png_to_r565_frame(png: bytes, resize_to: Optional[tuple[int, int]] = None, swap_bytes: bool = False) -> bytearray:
     img = Image.open(io.BytesIO(png)).convert("RGB")
     if resize_to:
         try:
@@ -212,15 +406,24 @@ def png_to_r565_frame(png: bytes, resize_to: Optional[tuple[int, int]] = None, s
             resample = Image.BILINEAR
         img = img.resize(resize_to, resample)
     w, h = img.size
-    raw = bytearray()
-    for r, g, b in img.getdata():
-        v = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-        if swap_bytes:
-            raw.extend(struct.pack(">H", v))
-        else:
-            raw.extend(struct.pack("<H", v))
-    # 8 bytes header: "R565" + w + h
-    return b"R565" + struct.pack("<HH", w, h) + bytes(raw)
+    # 8 bytes header: "R565" + w + h；像素直接写入预分配缓冲区，省去拼接拷贝
+    out = bytearray(8 + 2 * w * h)
+    out[0:4] = b"R565"
+    struct.pack_into("<HH", out, 4, w, h)
+    # 直接取 PIL 的原始 RGB 字节，不构造像素元组
+    rgb = np.frombuffer(img.tobytes(), dtype=np.uint8)
+    if _rgb_to_565 is not None:
+        # numba 并行内核：一次遍历完成掩码/移位/合并，结果为本机字节序
+        dst = np.frombuffer(out, dtype=np.uint16, count=w * h, offset=8)
+        _rgb_to_565(rgb.reshape(-1, 3), dst)
+        if swap_bytes != (sys.byteorder == "big"):
+            dst.byteswap(inplace=True)
+    else:
+        # 整图向量化转换，避免逐像素 Python 循环
+        arr = rgb.reshape(h, w, 3).astype(np.uint16)
+        v = ((arr[..., 0] & 0xF8) << 8) | ((arr[..., 1] & 0xFC) << 3) | (arr[..., 2] >> 3)
+        np.frombuffer(out, dtype=">u2" if swap_bytes else "<u2", count=w * h, offset=8)[:] = v.ravel()
+    return out
 
 
 
@@ -237,8 +440,10 @@ def run_demo(
     ):
     """演示：MSGF 按 hz 发送；IMGF 每 png_every_s 秒发一次（如果提供 png_path）"""
     period = 1.0 / hz
-    next_png = time.time() + png_every_s if (png_path and png_every_s > 0) else float("inf")
-    next_fetch = time.time() + track_every_s if fetcher else float("inf")
+    # 节拍与间隔计时统一使用单调时钟，不受系统校时影响；墙上时间仅用于 HH:MM 显示
+    monotonic = time.monotonic
+    next_png = monotonic() + png_every_s if (png_path and png_every_s > 0) else float("inf")
+    next_fetch = monotonic() + track_every_s if fetcher else float("inf")
     
     # 初始化一些演示数据
     speed = 80
@@ -251,24 +456,39 @@ def run_demo(
     fuel_total_dl = 520  # 52.0L，固定油箱容量
     fuel_left_dl = 360   # 36.0L
     out_t_target = random.randint(-200, 280)  # 单位 0.1°C
-    next_temp_tick = time.time()
-    next_batt_tick = time.time()
-
-    t0 = time.time()
-    last = time.time()
+    next_temp_tick = monotonic()
+    next_batt_tick = monotonic()
+
+    # 演示用速度/转速抖动表：按帧序号查表，替代每帧的取模与分支判断
+    # 周期分别为 7/11（速度）与 13/17（转速），表长取其最小公倍数
+    jitter_len = 7 * 11 * 13 * 17
+    speed_delta = tuple((t % 7 == 0) - (t % 11 == 0) for t in range(jitter_len))
+    rpm_delta = tuple(50 * ((t % 13 == 0) - (t % 17 == 0)) for t in range(jitter_len))
+    tick = 0
+
+    t0 = monotonic()
+    deadline = t0
+    curr_min = 0
+    last_lt_sec = -1
+    next_print = 0.0
 
     while True:
-        now = time.time()
+        now = monotonic()
 
         # 每秒更新一次“当前时间/行程时间”
         # 当前时间取本机当地时间（HH:MM），行程时间为运行分钟数
-        lt = time.localtime(now)
-        curr_min = lt.tm_hour * 60 + lt.tm_min
+        # localtime 开销较大，墙上时间每跨过一秒才重新计算
+        wall_sec = int(time.time())
+        if wall_sec != last_lt_sec:
+            lt = time.localtime(wall_sec)
+            curr_min = lt.tm_hour * 60 + lt.tm_min
+            last_lt_sec = wall_sec
         trip_min = int((now - t0) // 60)
 
         # 做一点随机抖动（可替换为真实数据源）
-        speed = max(0, min(132, speed + (1 if int(now*2) % 7 == 0 else 0) - (1 if int(now*3) % 11 == 0 else 0)))
-        rpm = max(0, min(8000, rpm + (50 if int(now*5) % 13 == 0 else 0) - (50 if int(now*7) % 17 == 0 else 0)))
+        tick = tick + 1 if tick + 1 < jitter_len else 0
+        speed = max(0, min(132, speed + speed_delta[tick]))
+        rpm = max(0, min(8000, rpm + rpm_delta[tick]))
         odo += max(0, speed)  # 粗略累加
         trip += max(0, speed)
 
@@ -301,50 +521,58 @@ def run_demo(
             fuel_left_dl=fuel_left_dl,
             fuel_total_dl=fuel_total_dl,
         )
-        print(
-            f" Sent MSGF {speed:03d} {rpm:04d} {odo:08d} {trip:08d} "
-            f"out={out_t/10:+05.1f}C in={in_t:02d}C batt={batt/1000:.2f}V "
-            f"{curr_min:04d} {trip_min:04d} {fuel_left_dl/10:.1f}/{fuel_total_dl/10:.1f}",
-            end="\r",
-        )
-        sender.send_msgf(snap, cmd=MSG_CMD_SNAPSHOT)
+        # 状态行限频到 4Hz，避免每帧格式化与终端输出占用主循环
+        if now >= next_print:
+            print(
+                f" Sent MSGF {speed:03d} {rpm:04d} {odo:08d} {trip:08d} "
+                f"out={out_t/10:+05.1f}C in={in_t:02d}C batt={batt/1000:.2f}V "
+                f"{curr_min:04d} {trip_min:04d} {fuel_left_dl/10:.1f}/{fuel_total_dl/10:.1f}",
+                end="\r",
+            )
+            next_print = now + 0.25
+        sender.send_msgf_fast(snap)
         
         # 原有：本地 PNG demo
         if now >= next_png and png_path:
-            with open(png_path, "rb") as f:
-                png = f.read()
             if img_mode == "r565":
-                frame = png_to_r565_frame(
-                    png,
+                frame = sender.load_r565_frame(
+                    png_path,
                     (img_w, img_h) if img_w and img_h else None,
                     swap_bytes=r565_swap_bytes,
                 )
                 sender.send_imgf_r565_bytes(frame)
             else:
-                sender.send_imgf_bytes(png)
+                sender.send_imgf_bytes(sender.load_png(png_path))
             next_png = now + png_every_s
 
-        # 新增：远程轨迹 PNG
-        if fetcher and now >= next_fetch:
-            png = fetcher.fetch_next()
-            if img_mode == "r565":
-                frame = png_to_r565_frame(
-                    png,
-                    (img_w, img_h) if img_w and img_h else None,
-                    swap_bytes=r565_swap_bytes,
-                )
-                sender.send_imgf_r565_bytes(frame)
-            else:
-                sender.send_imgf_bytes(png)
-            next_fetch = now + track_every_s
-
-
-        # 固定频率循环
-        elapsed = time.time() - last
-        sleep_s = period - elapsed
+        # 新增：远程轨迹 PNG（后台拉取，完成后再发送）
+        if fetcher:
+            if now >= next_fetch and not fetcher.pending:
+                fetcher.start_fetch()
+                next_fetch = now + track_every_s
+            fetched = fetcher.poll()
+            if fetched is not None:
+                png, fetch_ms = fetched
+                print(f"\r\n Fetched {len(png)} bytes in {fetch_ms:03d} ms")
+                if img_mode == "r565":
+                    frame = png_to_r565_frame(
+                        png,
+                        (img_w, img_h) if img_w and img_h else None,
+                        swap_bytes=r565_swap_bytes,
+                    )
+                    sender.send_imgf_r565_bytes(frame)
+                else:
+                    sender.send_imgf_bytes(png)
+
+
+        # 固定频率循环：按绝对截止时间推进，单帧超时不会累积漂移
+        deadline += period
+        sleep_s = deadline - monotonic()
         if sleep_s > 0:
             time.sleep(sleep_s)
-        last = time.time()
+        else:
+            # 严重超时后重新对齐，避免连续补发
+            deadline = monotonic()
 
 
 def run_once(sender: HostSender, speed: int, rpm: int, odo: int, trip: int, out_t: int, in_t: int, batt: int,
@@ -545,6 +773,8 @@ def main():
                     args.r565_swap_bytes, args.reboot_cmd, args.brightness, args.offset_rotation)
     finally:
         sender.close()
+        if fetcher:
+            fetcher.close()
 
 
 if __name__ == "__main__":